@@ -11,7 +11,9 @@ Parses the modular sensor library structure:
 """
 
 import os
+import stat
 import sys
+import tempfile
 from datetime import datetime
 from typing import List, Dict
 
@@ -80,9 +82,25 @@ def generate_enum_header(sensors: List[Dict], apps: List[Dict], output_path: str
     lines.append("#endif // PREOBD_REGISTRY_ENUMS_H")
     lines.append("")
 
-    # Write to file
-    with open(output_path, 'w') as f:
-        f.write('\n'.join(lines))
+    # Write to a temp file in the same directory and rename it into place,
+    # so an interrupted run never leaves a truncated header behind
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    try:
+        mode = stat.S_IMODE(os.stat(output_path).st_mode)
+    except FileNotFoundError:
+        # New file: use the mode open() would have given it
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    f = tempfile.NamedTemporaryFile('w', dir=output_dir, suffix='.tmp', delete=False)
+    try:
+        with f:
+            f.write('\n'.join(lines))
+        os.chmod(f.name, mode)  # NamedTemporaryFile creates files as 0600
+        os.replace(f.name, output_path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
 
     print(f"Generated {output_path}")
     print(f"  - {len(sensors)} sensor constants")
@@ -1,19 +1,74 @@
 """
 Parses C header files to extract registry data for sensors, applications, and units.
 """
+import functools
+import glob
+import hashlib
+import os
+import pickle
 import re
-from typing import List, Dict, Any, Optional
+import tempfile
+from collections import deque
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Pattern, Tuple
+
+# Parsed registries are cached here, keyed by the stat of every file they depend on
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.cache', 'registry')
+
+# PSTR definition with one or more concatenated string literals
+_RE_PSTR = re.compile(r'static const char (PSTR_\w+)\[\] PROGMEM = ((?:"[^"]*"\s*)+);')
+# A single quoted string literal
+_RE_QUOTED = re.compile(r'"([^"]*)"')
+# Enum constant definitions like "SENSOR_MAX6675 = 1"
+_RE_ENUM = re.compile(r'(\w+)\s*=\s*(\d+)')
+# Tokens that drive the struct entry scanner: string literals, comments and braces
+_RE_STRUCT_TOKEN = re.compile(r'"(?:[^"\\\n]|\\.)*"|//[^\n]*|/\*.*?\*/|[{}]', re.DOTALL)
+# Numeric literal in a struct field, classified by group name
+_RE_VALUE = re.compile(
+    r'(?P<hex>0[xX][0-9A-Fa-f]+)'
+    r'|(?P<float>[-+]?(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'|(?P<int>[-+]?\d+)'
+)
+# An index comment such as "// Index 3: COOLANT_TEMP" or "/* Index 3: */"
+_RE_INDEX_COMMENT = re.compile(r'(?://|/\*)\s*Index\s+(\d+):')
+# Backslash-newline macro continuation
+_RE_BACKSLASH_NL = re.compile(r'\\\n\s*')
+# Local (quoted) include directive
+_RE_INCLUDE = re.compile(r'#include\s+"([^"]+)"')
+# Compiled struct array patterns, keyed by struct name
+_BLOCK_CACHE: Dict[str, Pattern] = {}
+
+# C literals with a fixed Python value
+_LITERAL_TABLE = {'nullptr': None, 'true': True, 'false': False}
+
+# ASCII lower-to-upper byte table used by djb2_hash
+_UPPER_TBL = bytes.maketrans(bytes(range(0x61, 0x7B)), bytes(range(0x41, 0x5B)))
 
 def djb2_hash(s: str) -> int:
     """
     Computes a 16-bit, case-insensitive DJB2 hash of a string, matching the C implementation.
+    Only ASCII names are supported: the firmware hashes signed chars, so bytes
+    >= 0x80 hash differently there.
     """
     if not s:
         return 0
     hash_value = 5381
-    for c in s.upper():  # Case-insensitive
-        hash_value = ((hash_value << 5) + hash_value) + ord(c)
-    return hash_value & 0xFFFF  # 16-bit output
+    try:
+        data = s.encode('ascii')
+    except UnicodeEncodeError:
+        # Non-ASCII names keep the original per-character hash
+        for c in s.upper():
+            hash_value = ((hash_value << 5) + hash_value + ord(c)) & 0xFFFF
+        return hash_value
+    for b in data.translate(_UPPER_TBL):
+        hash_value = ((hash_value << 5) + hash_value + b) & 0xFFFF  # 16-bit output
+    return hash_value
+
+def djb2_hash_many(names: Iterable[str]) -> List[int]:
+    """
+    Computes djb2_hash for each name, in order.
+    Lets bulk callers hash a whole registry with one call.
+    """
+    return list(map(djb2_hash, names))
 
 def _parse_pstr_macros(content: str) -> Dict[str, str]:
     """Finds all PSTR string definitions and returns a lookup dictionary.
@@ -22,113 +77,186 @@ def _parse_pstr_macros(content: str) -> Dict[str, str]:
     static const char PSTR_FOO[] PROGMEM = "part1" "\\xC2\\xB0" "part2";
     """
     result = {}
-    # Match PSTR definition with one or more concatenated string literals
-    pstr_pattern = re.compile(
-        r'static const char (PSTR_\w+)\[\] PROGMEM = ((?:"[^"]*"\s*)+);'
-    )
-    for match in pstr_pattern.finditer(content):
+    if 'PSTR_' not in content:
+        return result
+    for match in _RE_PSTR.finditer(content):
         name = match.group(1)
-        # Extract all quoted strings and concatenate them
-        string_parts = re.findall(r'"([^"]*)"', match.group(2))
-        value = ''.join(string_parts)
+        literals = match.group(2).rstrip()
+        if literals.count('"') == 2:
+            # Single literal (the common case): just drop the quotes
+            value = literals[1:-1]
+        else:
+            # Extract all quoted strings and concatenate them
+            value = ''.join(_RE_QUOTED.findall(literals))
         result[name] = value
     return result
 
 def _extract_struct_block(content: str, struct_name: str) -> Optional[str]:
     """Extracts the full array definition for a given struct name."""
-    block_pattern = re.compile(
-        rf'static const PROGMEM \w+ {struct_name}\[\] = \{{(.*?)\}};\s*\n',
-        re.DOTALL
-    )
+    # Fast path: find "static const PROGMEM <Type> NAME[] = {" ... "};" with plain string searches
+    marker = f'{struct_name}[] = {{'
+    idx = content.find(marker)
+    if idx != -1:
+        decl_start = content.rfind('\n', 0, idx) + 1
+        prefix = 'static const PROGMEM '
+        type_name = content[decl_start + len(prefix):idx]
+        if (content.startswith(prefix, decl_start) and type_name.endswith(' ')
+                and type_name[:-1].isidentifier()):
+            start = idx + len(marker)
+            end = content.find('};', start)
+            if end != -1:
+                # The closing "};" must end its line
+                after = end + 2
+                while after < len(content) and content[after] in ' \t\r\f\v':
+                    after += 1
+                if after < len(content) and content[after] == '\n':
+                    return content[start:end]
+
+    # Fall back to the regex for anything the fast path doesn't recognise
+    block_pattern = _BLOCK_CACHE.get(struct_name)
+    if block_pattern is None:
+        block_pattern = re.compile(
+            rf'static const PROGMEM \w+ {struct_name}\[\] = \{{(.*?)\}};\s*\n',
+            re.DOTALL
+        )
+        _BLOCK_CACHE[struct_name] = block_pattern
     match = block_pattern.search(content)
     return match.group(1) if match else None
 
+@functools.lru_cache(maxsize=None)
+def _read_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, 'r') as f:
+        return f.read()
+
+def _read_file(path: str) -> str:
+    """
+    Returns the text of a file, reusing an earlier read while the file is unchanged.
+    Raises FileNotFoundError like open() if the file does not exist.
+    """
+    st = os.stat(path)
+    return _read_file_cached(path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=None)
+def _parse_enum_text(content: str) -> Dict[str, int]:
+    enum_map = {}
+    for match in _RE_ENUM.finditer(content):
+        name = match.group(1)
+        value = int(match.group(2))
+        enum_map[name] = value
+    return enum_map
+
 def _parse_enum_constants(enum_header_path: str) -> Dict[str, int]:
     """
     Parses the generated registry_enums.h to extract enum constant values.
     Returns a dictionary mapping enum names to their numeric values.
+    The dictionary is shared between callers and must not be modified.
     """
-    enum_map = {}
     try:
-        with open(enum_header_path, 'r') as f:
-            content = f.read()
-
-        # Match enum constant definitions like "SENSOR_MAX6675 = 1"
-        enum_pattern = re.compile(r'(\w+)\s*=\s*(\d+)')
-        for match in enum_pattern.finditer(content):
-            name = match.group(1)
-            value = int(match.group(2))
-            enum_map[name] = value
+        content = _read_file(enum_header_path)
     except FileNotFoundError:
         # If enum file doesn't exist yet, return empty map
-        pass
+        return {}
 
-    return enum_map
+    return _parse_enum_text(content)
+
+def _iter_struct_entries(content: str) -> Iterator[Tuple[Optional[int], str, str]]:
+    """
+    Walks a struct array block once, yielding one tuple per top-level entry.
+
+    Each tuple is (index, raw_block, body) where index comes from a preceding
+    "Index N:" comment (or None), raw_block is the entry text including its
+    braces, and body is the text inside the braces with comments removed.
+    """
+    depth = 0
+    index = None
+    entry_start = body_start = 0
+    body_parts = []
+    for token in _RE_STRUCT_TOKEN.finditer(content):
+        text = token.group()
+        if text[0] == '"':
+            # String literal: matched only so "//" or "}" inside it is left alone
+            continue
+        if text == '{':
+            depth += 1
+            if depth == 1:
+                entry_start = token.start()
+                body_start = token.end()
+                body_parts = []
+        elif text == '}':
+            if depth == 0:
+                continue
+            depth -= 1
+            if depth == 0:
+                body_parts.append(content[body_start:token.start()])
+                # Include the whitespace leading up to the opening brace
+                raw_start = entry_start
+                while raw_start > 0 and content[raw_start - 1].isspace():
+                    raw_start -= 1
+                yield index, content[raw_start:token.end()], ''.join(body_parts)
+                index = None
+        elif depth:
+            # Comment inside an entry: drop it from the body
+            body_parts.append(content[body_start:token.start()])
+            body_start = token.end()
+        else:
+            index_match = _RE_INDEX_COMMENT.match(text)
+            if index_match:
+                index = int(index_match.group(1))
 
-def _parse_structs(struct_content: str, pstr_macros: Dict[str, str], enum_constants: Dict[str, int] = None) -> List[Dict[str, Any]]:
+def _parse_structs(struct_content: str, pstr_macros: Dict[str, str], enum_constants: Dict[str, int] = None, include_raw: bool = False) -> List[Dict[str, Any]]:
     """
     Parses a block of C structs into a list of Python dictionaries.
-    Also captures the raw C block for each struct.
+    Optionally captures the raw C block for each struct.
 
     Args:
         struct_content: The C struct array content to parse
         pstr_macros: Dictionary mapping PSTR macro names to their string values
         enum_constants: Optional dictionary mapping enum names to their numeric values
+        include_raw: Also store 'raw_c_block' and 'used_pstr_macros' on each entry
     """
     if enum_constants is None:
         enum_constants = {}
 
-    # This pattern captures:
-    # 1. The entire struct block, including its preceding index comment.
-    # 2. The index number from the comment (optional).
-    # 3. The content inside the braces.
-    entry_pattern = re.compile(
-        r'((?:(?://|\/\*)\s*Index\s+(\d+):.*?\*\/?)?\s*\{(.+?)\s*\})',
-        re.DOTALL
-    )
-    # This pattern extracts individual fields from within a struct
-    field_pattern = re.compile(r'\.(\w+)\s*=\s*([^,]+),?')
-
     registries = []
     current_index = 0
-    for match in entry_pattern.finditer(struct_content):
-        raw_block = match.group(1)
-        index_str = match.group(2)
-        struct_data = match.group(3)
-
-        if index_str:
-            index = int(index_str)
-        else:
+    for index, raw_block, struct_data in _iter_struct_entries(struct_content):
+        if index is None:
             index = current_index
 
-        item = {'index': index, 'is_implemented': True, 'raw_c_block': raw_block, 'used_pstr_macros': []}
-
-        for field_match in field_pattern.finditer(struct_data):
-            key = field_match.group(1).strip()
-            value_str = field_match.group(2).strip().split('//')[0].strip()
+        item = {'index': index, 'is_implemented': True}
+        if include_raw:
+            item['raw_c_block'] = raw_block
+            item['used_pstr_macros'] = []
+
+        # Designated initializers: ".field = value" separated by commas
+        # (comments were already stripped by _iter_struct_entries)
+        for part in struct_data.split(','):
+            key, sep, value_str = part.partition('=')
+            key = key.strip()
+            if not sep or not key.startswith('.'):
+                continue
+            key = key[1:]
+            value_str = value_str.strip()
 
             if value_str in pstr_macros:
                 value = pstr_macros[value_str]
-                item['used_pstr_macros'].append(value_str)
+                if include_raw:
+                    item['used_pstr_macros'].append(value_str)
             elif value_str in enum_constants:
                 # Resolve enum constant to its numeric value
                 value = enum_constants[value_str]
-            elif value_str == 'nullptr':
-                value = None
-            elif value_str == 'true':
-                value = True
-            elif value_str == 'false':
-                value = False
-            elif value_str.startswith('0x'):
-                value = int(value_str, 16)
+            elif value_str in _LITERAL_TABLE:
+                value = _LITERAL_TABLE[value_str]
             else:
-                try:
-                    if '.' in value_str:
-                        value = float(value_str)
-                    else:
-                        value = int(value_str)
-                except ValueError:
+                number = _RE_VALUE.fullmatch(value_str)
+                if number is None:
                     value = value_str
+                elif number.lastgroup == 'hex':
+                    value = int(value_str, 16)
+                elif number.lastgroup == 'float':
+                    value = float(value_str)
+                else:
+                    value = int(value_str)
 
             item[key] = value
 
@@ -141,39 +269,79 @@ def _parse_structs(struct_content: str, pstr_macros: Dict[str, str], enum_consta
         current_index += 1
     return registries
 
-def _parse_x_macro_sensors(content: str, pstr_macros: Dict[str, str], base_dir: str) -> List[Dict[str, Any]]:
+_X_SENSOR_ARG_COUNT = 13
+
+def _is_x_sensor_args(args: List[str]) -> bool:
+    """
+    Checks that macro arguments look like a real sensor entry: the name must be
+    PSTR_xxx, the hash a hex literal and the pin type PIN_xxx. This filters out
+    the #define and comment examples like "X_SENSOR(name, label, ...)".
+    """
+    if len(args) != _X_SENSOR_ARG_COUNT or not all(args):
+        return False
+    name, hash_str, pin_type = args[0], args[11], args[12]
+    return (name.startswith('PSTR_') and name.isidentifier()
+            and hash_str[:2] == '0x' and len(hash_str) > 2
+            and all(c in '0123456789abcdefABCDEF' for c in hash_str[2:])
+            and pin_type.startswith('PIN_') and pin_type.isidentifier())
+
+def _iter_x_sensor_invocations(content: str) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Finds X_SENSOR(...) invocations with plain string searches, yielding
+    (raw_invocation, args) for each one that looks like a real sensor entry.
+    Args are stripped and have backslash-newline continuations removed.
+    """
+    pos = content.find('X_SENSOR')
+    while pos != -1:
+        open_pos = pos + len('X_SENSOR')
+        while open_pos < len(content) and content[open_pos].isspace():
+            open_pos += 1
+
+        if content.startswith('(', open_pos):
+            close_pos = content.find(')', open_pos)
+            inner = content[open_pos + 1:close_pos] if close_pos != -1 else ''
+            if '(' not in inner:
+                args = inner.split(',')
+            else:
+                # Nested parentheses: find the matching ')' and split on top-level commas
+                args = []
+                depth = 0
+                arg_start = open_pos + 1
+                close_pos = -1
+                for i in range(open_pos, len(content)):
+                    c = content[i]
+                    if c == '(':
+                        depth += 1
+                    elif c == ')':
+                        depth -= 1
+                        if depth == 0:
+                            close_pos = i
+                            break
+                    elif c == ',' and depth == 1:
+                        args.append(content[arg_start:i])
+                        arg_start = i + 1
+                if close_pos != -1:
+                    args.append(content[arg_start:close_pos])
+
+            if close_pos != -1:
+                args = [_RE_BACKSLASH_NL.sub('', arg.strip()) if '\\' in arg else arg.strip() for arg in args]
+                if _is_x_sensor_args(args):
+                    yield content[pos:close_pos + 1], args
+                    pos = content.find('X_SENSOR', close_pos + 1)
+                    continue
+
+        # Not a sensor entry; keep looking right after this occurrence
+        pos = content.find('X_SENSOR', pos + 1)
+
+def _parse_x_macro_sensors(content: str, pstr_macros: Dict[str, str], base_dir: str, include_raw: bool = False) -> List[Dict[str, Any]]:
     """
     Parses sensors defined using X-macro pattern.
     X_SENSOR(name, label, desc, readFn, initFn, measType, calType, defCal, minInt, minVal, maxVal, hash, pinType)
     """
     sensors = []
 
-    # Find all X_SENSOR macro invocations
-    # The pattern matches: X_SENSOR(PSTR_xxx, ...) - must start with PSTR_ to be a real sensor
-    # This filters out comment examples like "X_SENSOR(name, label, ...)"
-    x_sensor_pattern = re.compile(
-        r'X_SENSOR\s*\(\s*'
-        r'(PSTR_\w+),\s*'   # name - must be PSTR_xxx
-        r'([^,]+),\s*'   # label
-        r'([^,]+),\s*'   # description
-        r'([^,]+),\s*'   # readFunction
-        r'([^,]+),\s*'   # initFunction
-        r'([^,]+),\s*'   # measurementType
-        r'([^,]+),\s*'   # calibrationType
-        r'([^,]+),\s*'   # defaultCalibration
-        r'([^,]+),\s*'   # minReadInterval
-        r'([^,]+),\s*'   # minValue
-        r'([^,]+),\s*'   # maxValue
-        r'(0x[0-9A-Fa-f]+),\s*'   # nameHash - must be hex
-        r'(PIN_\w+)\s*\)', # pinTypeRequirement - must be PIN_xxx
-        re.MULTILINE
-    )
-
     index = 0
-    for match in x_sensor_pattern.finditer(content):
-        # Strip each arg and remove backslash-newline continuations
-        args = [re.sub(r'\\\n\s*', '', arg.strip()) for arg in match.groups()]
-
+    for raw_invocation, args in _iter_x_sensor_invocations(content):
         name_macro = args[0]
         label_macro = args[1]
         desc_macro = args[2]
@@ -203,9 +371,10 @@ def _parse_x_macro_sensors(content: str, pstr_macros: Dict[str, str], base_dir:
             'nameHash': name_hash,
             'pinTypeRequirement': pin_type,
             'is_implemented': label is not None,
-            'raw_c_block': match.group(0),
-            'used_pstr_macros': [name_macro] + ([label_macro] if label_macro != 'nullptr' else [])
         }
+        if include_raw:
+            sensor['raw_c_block'] = raw_invocation
+            sensor['used_pstr_macros'] = [name_macro] + ([label_macro] if label_macro != 'nullptr' else [])
         sensors.append(sensor)
         index += 1
 
@@ -216,105 +385,203 @@ def _collect_content_with_includes(header_path: str) -> str:
     """
     Reads the header file and recursively includes content from local includes.
     Only follows includes that are relative paths within sensor_library/.
+    Each file is read once, breadth-first, even if it is included from several places.
+    """
+    header_path = os.path.normpath(header_path)
+    parts = []
+    visited = set()
+    queue = deque([header_path])
+    while queue:
+        path = queue.popleft()
+        if path in visited:
+            continue
+        visited.add(path)
+        try:
+            content = _read_file(path)
+        except (OSError, UnicodeDecodeError):
+            # The top-level header must be readable; unreadable includes are skipped
+            if path == header_path:
+                raise
+            continue
+        parts.append(content)
+
+        base_dir = os.path.dirname(path)
+        # Follow local includes (quoted includes, not angle bracket)
+        for match in _RE_INCLUDE.finditer(content):
+            include_path = match.group(1)
+            # Only follow sensor_library/ includes
+            if 'sensor_library/' in include_path:
+                full_path = os.path.normpath(os.path.join(base_dir, include_path))
+                if full_path not in visited and os.path.exists(full_path):
+                    queue.append(full_path)
+
+    return '\n'.join(parts)
+
+
+def _header_dependencies(header_path: str, extra_dirs: Tuple[str, ...]) -> List[str]:
+    """Lists the files whose contents determine the parse result of header_path."""
+    header_dir = os.path.dirname(header_path)
+    paths = [header_path, os.path.join(header_dir, 'generated', 'registry_enums.h')]
+    for extra_dir in extra_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(header_dir, extra_dir, '**', '*.h'), recursive=True)))
+    return paths
+
+def _content_digest(paths: List[str]) -> str:
+    """Returns a blake2b digest over the names and bytes of the given files."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        h.update(path.encode('utf-8') + b'\0')
+        try:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b'\0missing')
+        h.update(b'\0')
+    return h.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _parser_version() -> str:
+    """Returns a digest of this module's source, so editing the parser invalidates the cache."""
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _header_cache(extra_dirs: Tuple[str, ...] = ()) -> Callable:
+    """
+    Caches a header parser's result on disk under tools/.cache/registry/.
+
+    Entries are keyed on a blake2b digest of the header, the generated
+    registry_enums.h and any headers under extra_dirs, so a touch or a fresh
+    checkout doesn't force a re-parse but any edit does. The key also holds a
+    digest of this module's source, so results from an older parser are never
+    reused. The (mtime_ns, size) of each file is stored alongside; when those
+    still match, the files are not read at all. Cache failures are never
+    fatal; the parser just runs.
     """
-    import os
+    def decorator(parse_fn: Callable) -> Callable:
+        @functools.wraps(parse_fn)
+        def wrapper(header_path: str, *args, **kwargs) -> List[Dict[str, Any]]:
+            header_path = os.path.abspath(header_path)
+            # Let a missing header raise FileNotFoundError from the parser as before
+            if not os.path.isfile(header_path):
+                return parse_fn(header_path, *args, **kwargs)
+
+            paths = _header_dependencies(header_path, extra_dirs)
+            stats = []
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                    stats.append((path, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    stats.append((path, None, None))
+            stats = tuple(stats)
+            call = (parse_fn.__name__, args, tuple(sorted(kwargs.items())))
+            key = (_parser_version(),) + call
+
+            # One cache file per header and argument set, so include_raw=True/False don't evict each other
+            digest = hashlib.sha1(f'{header_path}:{call!r}'.encode()).hexdigest()
+            cache_path = os.path.join(_CACHE_DIR, f'{digest}.pkl')
+            cached = None
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_key, cached_stats, cached_content, cached_result = pickle.load(f)
+                if cached_key == key:
+                    # Unchanged stat info is a hit without hashing any file
+                    if cached_stats == stats:
+                        return cached_result
+                    cached = (cached_content, cached_result)
+            except Exception:
+                pass
+
+            content = _content_digest(paths)
+            if cached is not None and cached[0] == content:
+                # Same bytes, new stat info: refresh the entry so the next run skips hashing
+                result = cached[1]
+            else:
+                result = parse_fn(header_path, *args, **kwargs)
 
-    with open(header_path, 'r') as f:
-        content = f.read()
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                with tempfile.NamedTemporaryFile(dir=_CACHE_DIR, suffix='.tmp', delete=False) as tmp:
+                    pickle.dump((key, stats, content, result), tmp, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp.name, cache_path)
+            except Exception:
+                pass
+            return result
+        return wrapper
+    return decorator
 
-    base_dir = os.path.dirname(header_path)
-    collected = content
 
-    # Find local includes (quoted includes, not angle bracket)
-    include_pattern = re.compile(r'#include\s+"([^"]+)"')
+def _load_header(header_path: str, struct_name: str, content: Optional[str] = None) -> Tuple[str, Dict[str, str], Dict[str, int], Optional[str]]:
+    """
+    Reads a registry header once and extracts what the parsers need from it.
 
-    for match in include_pattern.finditer(content):
-        include_path = match.group(1)
-        # Only follow sensor_library/ includes
-        if 'sensor_library/' in include_path:
-            full_path = os.path.normpath(os.path.join(base_dir, include_path))
-            if os.path.exists(full_path):
-                try:
-                    with open(full_path, 'r') as f:
-                        collected += "\n" + f.read()
-                except:
-                    pass
+    Returns (content, pstr_macros, enum_constants, struct_content). Pass content
+    to reuse text that has already been read, e.g. with includes collected.
+    """
+    if content is None:
+        content = _read_file(header_path)
 
-    return collected
+    pstr_macros = _parse_pstr_macros(content)
 
+    # Load enum constants from generated header
+    enum_header_path = os.path.join(os.path.dirname(header_path), 'generated', 'registry_enums.h')
+    enum_constants = _parse_enum_constants(enum_header_path)
+
+    struct_content = _extract_struct_block(content, struct_name)
+    return content, pstr_macros, enum_constants, struct_content
 
-def parse_sensor_library(header_path: str) -> List[Dict[str, Any]]:
+
+@_header_cache(extra_dirs=('sensor_library',))
+def parse_sensor_library(header_path: str, include_raw: bool = False) -> List[Dict[str, Any]]:
     """
     Parses sensor_library.h to extract a list of sensor dictionaries.
     Supports both traditional struct syntax and X-macro pattern.
+    Pass include_raw=True to keep each entry's raw C text and PSTR macro names.
     """
-    import os
-
     # Collect content from main file and included sensor files
-    content = _collect_content_with_includes(header_path)
-
-    pstr_macros = _parse_pstr_macros(content)
+    content, pstr_macros, enum_constants, struct_content = _load_header(
+        header_path, 'SENSOR_LIBRARY', _collect_content_with_includes(header_path))
     if 'PSTR_NONE' not in pstr_macros:
         pstr_macros['PSTR_NONE'] = 'NONE'
 
-    # Load enum constants from generated header
-    enum_header_path = os.path.join(os.path.dirname(header_path), 'generated', 'registry_enums.h')
-    enum_constants = _parse_enum_constants(enum_header_path)
-
     base_dir = os.path.dirname(header_path)
 
     # First try X-macro pattern (new modular structure)
-    sensors = _parse_x_macro_sensors(content, pstr_macros, base_dir)
+    sensors = _parse_x_macro_sensors(content, pstr_macros, base_dir, include_raw)
     if sensors:
         return sensors
 
     # Fall back to traditional struct syntax
-    struct_content = _extract_struct_block(content, 'SENSOR_LIBRARY')
     if not struct_content:
         return []
 
-    return _parse_structs(struct_content, pstr_macros, enum_constants)
+    return _parse_structs(struct_content, pstr_macros, enum_constants, include_raw)
 
 
-def parse_application_presets(header_path: str) -> List[Dict[str, Any]]:
+@_header_cache()
+def parse_application_presets(header_path: str, include_raw: bool = False) -> List[Dict[str, Any]]:
     """
     Parses application_presets.h to extract a list of application dictionaries.
+    Pass include_raw=True to keep each entry's raw C text and PSTR macro names.
     """
-    with open(header_path, 'r') as f:
-        content = f.read()
-
-    pstr_macros = _parse_pstr_macros(content)
+    _, pstr_macros, enum_constants, struct_content = _load_header(header_path, 'APPLICATION_PRESETS')
     if 'PSTR_APP_NONE' not in pstr_macros:
         pstr_macros['PSTR_APP_NONE'] = 'NONE'
 
-    # Load enum constants from generated header
-    import os
-    enum_header_path = os.path.join(os.path.dirname(header_path), 'generated', 'registry_enums.h')
-    enum_constants = _parse_enum_constants(enum_header_path)
-
-    struct_content = _extract_struct_block(content, 'APPLICATION_PRESETS')
     if not struct_content:
         return []
 
-    return _parse_structs(struct_content, pstr_macros, enum_constants)
+    return _parse_structs(struct_content, pstr_macros, enum_constants, include_raw)
 
 
-def parse_units_registry(header_path: str) -> List[Dict[str, Any]]:
+@_header_cache()
+def parse_units_registry(header_path: str, include_raw: bool = False) -> List[Dict[str, Any]]:
     """
     Parses units_registry.h to extract a list of unit dictionaries.
+    Pass include_raw=True to keep each entry's raw C text and PSTR macro names.
     """
-    with open(header_path, 'r') as f:
-        content = f.read()
-
-    pstr_macros = _parse_pstr_macros(content)
-
-    # Load enum constants from generated header
-    import os
-    enum_header_path = os.path.join(os.path.dirname(header_path), 'generated', 'registry_enums.h')
-    enum_constants = _parse_enum_constants(enum_header_path)
-
-    struct_content = _extract_struct_block(content, 'UNITS_REGISTRY')
+    _, pstr_macros, enum_constants, struct_content = _load_header(header_path, 'UNITS_REGISTRY')
     if not struct_content:
         return []
 
-    return _parse_structs(struct_content, pstr_macros, enum_constants)
+    return _parse_structs(struct_content, pstr_macros, enum_constants, include_raw)
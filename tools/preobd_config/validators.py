@@ -1,10 +1,18 @@
 """
 Validation functions for checking the integrity of registry data.
 """
-import re
-from typing import List, Dict, Any, Tuple
+from collections import Counter
+from typing import Iterable, List, Dict, Any, Tuple
 
-from .registry_parser import djb2_hash
+from .registry_parser import djb2_hash_many
+
+# Number of evenly spaced entries per registry checked by validate_hash_algorithm(fast=True),
+# on top of the first and last entries
+FAST_HASH_SAMPLE_SIZE = 10
+
+def _has_duplicates(hashes: Iterable[int]) -> bool:
+    """Returns True if any hash value occurs more than once."""
+    return any(count > 1 for count in Counter(hashes).values())
 
 def validate_hash_collisions(
     sensors: List[Dict[str, Any]],
@@ -16,66 +24,104 @@ def validate_hash_collisions(
     Returns a list of error messages.
     """
     errors = []
+    # Counting hashes first lets a collision-free registry (the normal case) skip
+    # the reporting loop, which is only needed to name the colliding entries.
+
     # Check for collisions within sensors
-    hashes = {}
-    for sensor in sensors:
-        if not sensor.get("name"): continue
-        h = sensor["nameHash"]
-        if h in hashes:
-            errors.append(f"Sensor hash collision: {sensor['name']} and {hashes[h]} have the same hash 0x{h:04X}")
-        else:
-            hashes[h] = sensor["name"]
+    if _has_duplicates(s["nameHash"] for s in sensors if s.get("name")):
+        hashes = {}
+        for sensor in sensors:
+            name = sensor.get("name")
+            if not name: continue
+            h = sensor["nameHash"]
+            if h in hashes:
+                errors.append(f"Sensor hash collision: {name} and {hashes[h]} have the same hash 0x{h:04X}")
+            else:
+                hashes[h] = name
 
     # Check for collisions within applications
-    hashes = {}
-    for app in apps:
-        if not app.get("name"): continue
-        h = app["nameHash"]
-        if h in hashes:
-            errors.append(f"Application hash collision: {app['name']} and {hashes[h]} have the same hash 0x{h:04X}")
-        else:
-            hashes[h] = app["name"]
-
-    # Check for collisions within units (name and alias)
-    hashes = {}
+    if _has_duplicates(a["nameHash"] for a in apps if a.get("name")):
+        hashes = {}
+        for app in apps:
+            name = app.get("name")
+            if not name: continue
+            h = app["nameHash"]
+            if h in hashes:
+                errors.append(f"Application hash collision: {name} and {hashes[h]} have the same hash 0x{h:04X}")
+            else:
+                hashes[h] = name
+
+    # Check for collisions within units (name and alias); an alias may share its own name's hash
+    unit_hashes = []
     for unit in units:
         if not unit.get("name"): continue
-        h_name = unit["nameHash"]
-        h_alias = unit["aliasHash"]
-        if h_name in hashes:
-            errors.append(f"Unit hash collision: {unit['name']} and {hashes[h_name]} have the same hash 0x{h_name:04X}")
-        else:
-            hashes[h_name] = unit["name"]
-        if h_alias in hashes and h_alias != h_name:
-            errors.append(f"Unit alias hash collision: {unit['alias']} and {hashes[h_alias]} have the same hash 0x{h_alias:04X}")
-        else:
-            hashes[h_alias] = unit["alias"]
+        unit_hashes.append(unit["nameHash"])
+        if unit["aliasHash"] != unit["nameHash"]:
+            unit_hashes.append(unit["aliasHash"])
+    if _has_duplicates(unit_hashes):
+        hashes = {}
+        for unit in units:
+            name = unit.get("name")
+            if not name: continue
+            alias = unit["alias"]
+            h_name = unit["nameHash"]
+            h_alias = unit["aliasHash"]
+            if h_name in hashes:
+                errors.append(f"Unit hash collision: {name} and {hashes[h_name]} have the same hash 0x{h_name:04X}")
+            else:
+                hashes[h_name] = name
+            if h_alias in hashes and h_alias != h_name:
+                errors.append(f"Unit alias hash collision: {alias} and {hashes[h_alias]} have the same hash 0x{h_alias:04X}")
+            else:
+                hashes[h_alias] = alias
 
     return errors
 
-def validate_index_references(
+def _index_sensors(sensors: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Maps sensor index to sensor; on duplicate indices the first entry wins."""
+    sensors_by_index = {}
+    for sensor in sensors:
+        sensors_by_index.setdefault(sensor['index'], sensor)
+    return sensors_by_index
+
+def _reference_problems(
     apps: List[Dict[str, Any]],
     sensors: List[Dict[str, Any]]
-) -> Tuple[List[str], List[str]]:
+) -> Tuple[List[str], List[str], List[str]]:
     """
-    Checks that defaultSensor in applications points to a valid, implemented sensor.
-    Returns a tuple of (errors, warnings).
+    Checks each implemented application's defaultSensor in one pass.
+    Returns (reference errors, reference warnings, measurement type errors).
     """
-    errors = []
-    warnings = []
-    sensor_indices = {s['index'] for s in sensors}
+    ref_errors = []
+    ref_warnings = []
+    type_errors = []
+    sensors_by_index = _index_sensors(sensors)
 
     for app in apps:
         if not app.get("is_implemented"): continue
 
         sensor_index = app.get("defaultSensor")
-        if sensor_index not in sensor_indices:
-            errors.append(f"APP[{app['index']}]:{app['name']} references non-existent SENSOR[{sensor_index}]")
-        else:
-            sensor = next(s for s in sensors if s['index'] == sensor_index)
-            if not sensor['is_implemented']:
-                warnings.append(f"APP[{app['index']}]:{app['name']} references unimplemented SENSOR[{sensor_index}]")
+        sensor = sensors_by_index.get(sensor_index)
+        if sensor is None:
+            ref_errors.append(f"APP[{app['index']}]:{app['name']} references non-existent SENSOR[{sensor_index}]")
+        elif not sensor['is_implemented']:
+            ref_warnings.append(f"APP[{app['index']}]:{app['name']} references unimplemented SENSOR[{sensor_index}]")
+        elif app['expectedMeasurementType'] != sensor['measurementType']:
+            type_errors.append(
+                f"Measurement type mismatch in APP[{app['index']}]:{app['name']}. "
+                f"Expected {app['expectedMeasurementType']}, but SENSOR[{sensor_index}] provides {sensor['measurementType']}"
+            )
+    return ref_errors, ref_warnings, type_errors
 
+def validate_index_references(
+    apps: List[Dict[str, Any]],
+    sensors: List[Dict[str, Any]]
+) -> Tuple[List[str], List[str]]:
+    """
+    Checks that defaultSensor in applications points to a valid, implemented sensor.
+    Returns a tuple of (errors, warnings).
+    """
+    errors, warnings, _ = _reference_problems(apps, sensors)
     return errors, warnings
 
 def validate_measurement_types(
@@ -86,51 +132,74 @@ def validate_measurement_types(
     Checks that the default sensor for an application has a matching measurement type.
     Returns a list of error messages.
     """
-    errors = []
-    for app in apps:
-        if not app.get("is_implemented"): continue
+    return _reference_problems(apps, sensors)[2]
+
+def _hash_mismatches(
+    entries: List[Dict[str, Any]],
+    name_key: str,
+    hash_key: str,
+    fast: bool
+) -> List[Tuple[Dict[str, Any], int]]:
+    """
+    Recomputes the hash of entry[name_key] for every entry that has one and
+    returns (entry, expected_hash) pairs where it differs from entry[hash_key].
+    With fast=True only the first, last and an evenly spaced sample of entries are
+    checked, so repeated runs on the same registry check the same entries.
+    """
+    named = [e for e in entries if e.get(name_key)]
+    if fast and len(named) > FAST_HASH_SAMPLE_SIZE + 2:
+        last = len(named) - 1
+        picks = [i * last // (FAST_HASH_SAMPLE_SIZE + 1) for i in range(FAST_HASH_SAMPLE_SIZE + 2)]
+        named = [named[i] for i in picks]
 
-        sensor_index = app.get("defaultSensor")
-        sensor = next((s for s in sensors if s['index'] == sensor_index), None)
-        if sensor and sensor['is_implemented']:
-            if app['expectedMeasurementType'] != sensor['measurementType']:
-                errors.append(
-                    f"Measurement type mismatch in APP[{app['index']}]:{app['name']}. "
-                    f"Expected {app['expectedMeasurementType']}, but SENSOR[{sensor_index}] provides {sensor['measurementType']}"
-                )
-    return errors
+    expected_hashes = djb2_hash_many(e[name_key] for e in named)
+    return [(e, h) for e, h in zip(named, expected_hashes) if h != e[hash_key]]
 
 def validate_hash_algorithm(
     sensors: List[Dict[str, Any]],
     apps: List[Dict[str, Any]],
-    units: List[Dict[str, Any]]
+    units: List[Dict[str, Any]],
+    fast: bool = False
 ) -> List[str]:
     """
     Re-computes hashes and verifies they match the stored values.
+    With fast=True, only samples each registry (see FAST_HASH_SAMPLE_SIZE); this
+    is enough when the hashes were generated by the same djb2_hash.
     Returns a list of error messages.
     """
     errors = []
-    for sensor in sensors:
-        if sensor.get("name"):
-            expected_hash = djb2_hash(sensor["name"])
-            if expected_hash != sensor["nameHash"]:
-                errors.append(f"Hash mismatch for SENSOR[{sensor['index']}]:{sensor['name']}. Expected 0x{expected_hash:04X}, found 0x{sensor['nameHash']:04X}")
+    for sensor, expected_hash in _hash_mismatches(sensors, "name", "nameHash", fast):
+        errors.append(f"Hash mismatch for SENSOR[{sensor['index']}]:{sensor['name']}. Expected 0x{expected_hash:04X}, found 0x{sensor['nameHash']:04X}")
 
-    for app in apps:
-        if app.get("name"):
-            expected_hash = djb2_hash(app["name"])
-            if expected_hash != app["nameHash"]:
-                errors.append(f"Hash mismatch for APP[{app['index']}]:{app['name']}. Expected 0x{expected_hash:04X}, found 0x{app['nameHash']:04X}")
+    for app, expected_hash in _hash_mismatches(apps, "name", "nameHash", fast):
+        errors.append(f"Hash mismatch for APP[{app['index']}]:{app['name']}. Expected 0x{expected_hash:04X}, found 0x{app['nameHash']:04X}")
 
-    for unit in units:
-        if unit.get("name"):
-            expected_hash = djb2_hash(unit["name"])
-            if expected_hash != unit["nameHash"]:
-                errors.append(f"Hash mismatch for UNIT[{unit['index']}]:{unit['name']}. Expected 0x{expected_hash:04X}, found 0x{unit['nameHash']:04X}")
-        if unit.get("alias"):
-            expected_hash = djb2_hash(unit["alias"])
-            if expected_hash != unit["aliasHash"]:
-                errors.append(f"Alias hash mismatch for UNIT[{unit['index']}]:{unit['alias']}. Expected 0x{expected_hash:04X}, found 0x{unit['aliasHash']:04X}")
+    for unit, expected_hash in _hash_mismatches(units, "name", "nameHash", fast):
+        errors.append(f"Hash mismatch for UNIT[{unit['index']}]:{unit['name']}. Expected 0x{expected_hash:04X}, found 0x{unit['nameHash']:04X}")
+
+    for unit, expected_hash in _hash_mismatches(units, "alias", "aliasHash", fast):
+        errors.append(f"Alias hash mismatch for UNIT[{unit['index']}]:{unit['alias']}. Expected 0x{expected_hash:04X}, found 0x{unit['aliasHash']:04X}")
 
     return errors
 
+def validate_all(
+    sensors: List[Dict[str, Any]],
+    apps: List[Dict[str, Any]],
+    units: List[Dict[str, Any]],
+    fast: bool = False
+) -> Dict[str, Tuple[List[str], List[str]]]:
+    """
+    Runs the hash algorithm, hash collision, index reference and measurement
+    type checks. References and measurement types share one pass over apps.
+    fast is passed on to validate_hash_algorithm.
+    Returns a dict mapping each check ('hashes', 'collisions', 'references',
+    'types') to its (errors, warnings), with the same messages as the
+    individual validators.
+    """
+    ref_errors, ref_warnings, type_errors = _reference_problems(apps, sensors)
+    return {
+        'hashes': (validate_hash_algorithm(sensors, apps, units, fast), []),
+        'collisions': (validate_hash_collisions(sensors, apps, units), []),
+        'references': (ref_errors, ref_warnings),
+        'types': (type_errors, []),
+    }
@@ -18,18 +18,6 @@ from typing import List, Dict, Any
 # Ensure the script can find the preobd_config package
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
 
-from preobd_config.registry_parser import (
-    parse_sensor_library,
-    parse_application_presets,
-    parse_units_registry,
-)
-from preobd_config.validators import (
-    validate_hash_collisions,
-    validate_index_references,
-    validate_measurement_types,
-    validate_hash_algorithm,
-)
-
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description="preOBD Registry Validation Tool")
@@ -43,82 +31,101 @@ def main():
         action="store_true",
         help="Enable CI mode (machine-readable exit codes).",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Recompute only a sample of each registry's hashes.",
+    )
     args = parser.parse_args()
 
-    print("=== preOBD Registry Validation ===")
-
-    # Load registries
-    try:
-        sensors = parse_sensor_library(os.path.join(args.project_dir, "src/lib/sensor_library.h"))
-        apps = parse_application_presets(os.path.join(args.project_dir, "src/lib/application_presets.h"))
-        units = parse_units_registry(os.path.join(args.project_dir, "src/lib/units_registry.h"))
-    except FileNotFoundError as e:
-        print(f"\n\u2717 Critical Error: Could not find a registry file. {e}", file=sys.stderr)
+    # Resolve the project root once; parsers receive ready-made absolute paths
+    project_dir = os.path.realpath(args.project_dir)
+    if not os.path.isdir(project_dir):
+        print(f"\u2717 Critical Error: Project directory not found: {args.project_dir}", file=sys.stderr)
         sys.exit(1)
 
-    all_errors = []
-    all_warnings = []
+    lib_dir = os.path.join(project_dir, "src", "lib")
+    sensor_lib_path = os.path.join(lib_dir, "sensor_library.h")
+    app_presets_path = os.path.join(lib_dir, "application_presets.h")
+    units_path = os.path.join(lib_dir, "units_registry.h")
 
-    # Run validations
-    print("\nChecking sensor_library.h...")
-    print(f"  \u2713 {len(sensors)} sensors loaded (from sensor_library/sensors/*.h)")
+    # Imported here so --help and a bad --project-dir don't pay for loading the parsers
+    from preobd_config.registry_parser import (
+        parse_sensor_library,
+        parse_application_presets,
+        parse_units_registry,
+    )
+    from preobd_config.validators import validate_all
 
-    print("\nChecking application_presets.h...")
-    print(f"  \u2713 {len(apps)} applications loaded")
+    # Report lines are collected and written to stdout in one go
+    log = ["=== preOBD Registry Validation ==="]
 
-    print("\nChecking units_registry.h...")
-    print(f"  \u2713 {len(units)} units loaded")
+    def flush_log():
+        sys.stdout.write("\n".join(log) + "\n")
+        sys.stdout.flush()
+        log.clear()
 
-    print("\nChecking hash algorithm correctness...")
-    hash_errors = validate_hash_algorithm(sensors, apps, units)
-    if hash_errors:
-        all_errors.extend(hash_errors)
-        for err in hash_errors: print(f"  \u2717 {err}")
-    else:
-        print("  \u2713 All hashes match djb2 algorithm")
+    # Report every missing registry header at once rather than failing on the first
+    missing = [path for path in (sensor_lib_path, app_presets_path, units_path) if not os.path.isfile(path)]
+    if missing:
+        flush_log()
+        sys.stderr.writelines(f"\u2717 Critical Error: Could not find a registry file: {path}\n" for path in missing)
+        sys.exit(1)
 
-    print("\nChecking for hash collisions...")
-    collision_errors = validate_hash_collisions(sensors, apps, units)
-    if collision_errors:
-        all_errors.extend(collision_errors)
-        for err in collision_errors: print(f"  \u2717 {err}")
-    else:
-        print("  \u2713 No hash collisions found")
-
-    print("\nChecking cross-references...")
-    ref_errors, ref_warnings = validate_index_references(apps, sensors)
-    if ref_errors:
-        all_errors.extend(ref_errors)
-        for err in ref_errors: print(f"  \u2717 {err}")
-    if ref_warnings:
-        all_warnings.extend(ref_warnings)
-        for warn in ref_warnings: print(f"  \u26A0 {warn}")
-    if not ref_errors and not ref_warnings:
-        print("  \u2713 All index references are valid")
-
-    print("\nChecking measurement types...")
-    type_errors = validate_measurement_types(apps, sensors)
-    if type_errors:
-        all_errors.extend(type_errors)
-        for err in type_errors: print(f"  \u2717 {err}")
-    else:
-        print("  \u2713 All measurement types are consistent")
+    # Load registries
+    sensors = parse_sensor_library(sensor_lib_path)
+    apps = parse_application_presets(app_presets_path)
+    units = parse_units_registry(units_path)
+
+    all_errors = []
+    all_warnings = []
+
+    # Run validations
+    log.append("\nChecking sensor_library.h...")
+    log.append(f"  \u2713 {len(sensors)} sensors loaded (from sensor_library/sensors/*.h)")
+
+    log.append("\nChecking application_presets.h...")
+    log.append(f"  \u2713 {len(apps)} applications loaded")
+
+    log.append("\nChecking units_registry.h...")
+    log.append(f"  \u2713 {len(units)} units loaded")
+
+    # Each check gets its original headline, with its problems (stderr) or success line under it
+    sections = {
+        "hashes": ("Checking hash algorithm correctness...", "All hashes match djb2 algorithm"),
+        "collisions": ("Checking for hash collisions...", "No hash collisions found"),
+        "references": ("Checking cross-references...", "All index references are valid"),
+        "types": ("Checking measurement types...", "All measurement types are consistent"),
+    }
+    for check, (errors, warnings) in validate_all(sensors, apps, units, fast=args.fast).items():
+        headline, passed = sections[check]
+        log.append(f"\n{headline}")
+        all_errors.extend(errors)
+        all_warnings.extend(warnings)
+        if errors or warnings:
+            flush_log()
+            sys.stderr.writelines([f"  \u2717 {err}\n" for err in errors] +
+                                  [f"  \u26A0 {warn}\n" for warn in warnings])
+            sys.stderr.flush()
+        else:
+            log.append(f"  \u2713 {passed}")
+
+    # In CI mode only the exit code matters once errors are found; the errors
+    # themselves have already been reported above
+    if args.ci and all_errors:
+        flush_log()
+        sys.exit(1)
 
     # Final summary
-    print("\n=== Summary ===")
+    log.append("\n=== Summary ===")
     status_str = f"({len(all_errors)} errors, {len(all_warnings)} warnings)"
     if not all_errors and not all_warnings:
-        print("Status: PASSED")
+        log.append("Status: PASSED")
     elif not all_errors and all_warnings:
-        print(f"Status: PASSED WITH WARNINGS {status_str}")
+        log.append(f"Status: PASSED WITH WARNINGS {status_str}")
     else:
-        print(f"Status: FAILED {status_str}")
-
-    if args.ci:
-        if all_errors:
-            sys.exit(1)
-
-    sys.exit(0)
+        log.append(f"Status: FAILED {status_str}")
+    flush_log()
 
 if __name__ == "__main__":
     main()